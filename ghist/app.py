@@ -78,6 +78,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         tui.run()
     except KeyboardInterrupt:
         return 130
+    finally:
+        repo.close()
     return 0
 
 
@@ -1,23 +1,96 @@
 from __future__ import annotations
 
+import os
+import re
 import subprocess
-from dataclasses import dataclass
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from functools import lru_cache
-from typing import Iterable, List, Optional
+from typing import IO, Any, Hashable, Iterable, Iterator, List, Literal, Optional
 
+# One ``\x1e``-terminated record per commit in ``git log`` output, captured as
+# its seven ``\x1f``-separated fields (the body may contain anything but the
+# record separator). The ``format:`` separator newline before every record
+# after the first is consumed here so no field needs stripping.
+_LOG_RECORD_RE = re.compile(
+    rb"\n?" + rb"([^\x1e\x1f]*)\x1f" * 6 + rb"([^\x1e]*)\x1e"
+)
+_READ_SIZE = 1 << 16
+# Keep non-ASCII paths unquoted in git's output, and blank context lines
+# prefixed with a space (even plumbing honours diff.suppressBlankEmpty,
+# which would leave them as bare newlines the diff parser cannot count).
+_GIT = (
+    "git",
+    "-c",
+    "core.quotepath=false",
+    "-c",
+    "diff.suppressBlankEmpty=false",
+)
+# Echoed back by ``git diff-tree --stdin`` after each request's output. It
+# only ends a response as the whole output (an empty diff) or as a line of
+# its own: patch lines always start with a prefix character, but file
+# contents may still contain the marker text after it.
+_DIFF_END = b"\x1eghist-end\n"
+_DIFF_LINE_END = b"\n" + _DIFF_END
+# Upper bounds (in bytes of Python object memory) for the revision caches.
+CONTENTS_CACHE_BYTES = 64 * 1024 * 1024
+DIFF_CACHE_BYTES = 32 * 1024 * 1024
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GitCommit:
     """Container for the metadata needed by the TUI."""
 
     oid: str
-    parent_oids: List[str]
+    parent_oids: tuple[str, ...]
     author_name: str
     author_email: str
     authored_at: datetime
     title: str
     body: str
+    date_str: str = field(default="", compare=False)
+    author: str = field(init=False, default="", compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Display strings are baked once here rather than on every render.
+        if not self.date_str:
+            date_str = self.authored_at.strftime("%Y-%m-%d %H:%M:%S")
+            object.__setattr__(self, "date_str", date_str)
+        author = f"{self.author_name} <{self.author_email}>"
+        object.__setattr__(self, "author", author)
+
+
+class _ByteLRU:
+    """Least-recently-used mapping bounded by the total size of its values."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
 
 
 class GitRepository:
@@ -25,17 +98,46 @@ class GitRepository:
 
     def __init__(self, path: str) -> None:
         self._path = path
+        self._cat_file: subprocess.Popen | None = None
+        self._cat_lock = threading.Lock()
+        self._diff_tree: subprocess.Popen | None = None
+        self._diff_tree_path: str | None = None
+        self._diff_lock = threading.Lock()
+        self._contents_cache = _ByteLRU(CONTENTS_CACHE_BYTES)
+        self._lines_cache = _ByteLRU(CONTENTS_CACHE_BYTES)
+        self._diff_cache = _ByteLRU(DIFF_CACHE_BYTES)
 
     @property
     def path(self) -> str:
         return self._path
 
-    def _run(self, *args: str, text: bool = True) -> subprocess.CompletedProcess:
+    def close(self) -> None:
+        """Shut down the persistent git processes, if running."""
+        with self._cat_lock:
+            proc, self._cat_file = self._cat_file, None
+        _stop(proc)
+        with self._diff_lock:
+            proc, self._diff_tree = self._diff_tree, None
+        _stop(proc)
+
+    def __enter__(self) -> "GitRepository":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        """Run git to completion and return its raw (bytes) output."""
         try:
             return subprocess.run(
-                ["git", *args],
+                [*_GIT, *args],
                 cwd=self._path,
-                text=text,
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -43,14 +145,193 @@ class GitRepository:
         except FileNotFoundError as exc:
             raise GitError("git executable not found") from exc
         except subprocess.CalledProcessError as exc:
-            raise GitError(exc.stderr.strip() or exc.stdout.strip()) from exc
+            message = exc.stderr.strip() or exc.stdout.strip()
+            raise GitError(message.decode("utf-8", "replace")) from exc
+
+    def _popen(self, *args: str) -> subprocess.Popen:
+        try:
+            return subprocess.Popen(
+                [*_GIT, *args],
+                cwd=self._path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=_READ_SIZE,
+            )
+        except FileNotFoundError as exc:
+            raise GitError("git executable not found") from exc
+
+    def _start_batch(self, *args: str) -> subprocess.Popen:
+        """Start a long-lived git process answering requests over stdin."""
+        try:
+            return subprocess.Popen(
+                [*_GIT, *args],
+                cwd=self._path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except FileNotFoundError as exc:
+            raise GitError("git executable not found") from exc
+
+    def _cat(self, oid: str, file_path: str) -> str:
+        """Read ``oid:file_path`` through a long-lived ``git cat-file --batch``."""
+        data = self._cat_object(f"{oid}:{file_path}")
+        if data is None:
+            raise GitError(f"fatal: path '{file_path}' does not exist in '{oid}'")
+        return data.decode("utf-8", "replace")
+
+    def _cat_object(self, name: str) -> bytearray | None:
+        """Return the raw object ``name`` names, or None if it is missing."""
+        with self._cat_lock:
+            if self._cat_file is None or self._cat_file.poll() is not None:
+                self._cat_file = self._start_batch("cat-file", "--batch")
+            proc = self._cat_file
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write(f"{name}\n".encode())
+                header = proc.stdout.readline()
+                if not header:
+                    raise GitError("git cat-file exited unexpectedly")
+                # "<object> missing" / "<object> ambiguous"; the object name
+                # echoes the path, which may itself contain spaces.
+                if header.endswith((b" missing\n", b" ambiguous\n")):
+                    return None
+                # "<sha> <type> <size>"
+                size = int(header.rsplit(b" ", 2)[2])
+                # The size is known up front: read straight into one buffer
+                # (contents plus git's trailing newline) instead of growing it.
+                data = bytearray(size + 1)
+                filled = 0
+                with memoryview(data) as view:
+                    while filled <= size:
+                        count = proc.stdout.readinto(view[filled:])
+                        if not count:
+                            raise GitError("git cat-file exited unexpectedly")
+                        filled += count
+            except (BrokenPipeError, ValueError) as exc:
+                raise GitError("git cat-file exited unexpectedly") from exc
+        del data[size:]
+        return data
+
+    def _diff(self, oid: str, file_path: str, parent_oid: Optional[str]) -> str:
+        """Diff ``oid`` through a long-lived ``git diff-tree --stdin``.
+
+        The pathspec is fixed when the process starts, so it is restarted
+        whenever a different file is asked for.
+        """
+        request = f"{oid} {parent_oid}\n" if parent_oid else f"{oid}\n"
+        with self._diff_lock:
+            proc = self._diff_tree
+            if proc is None or proc.poll() is not None or (
+                self._diff_tree_path != file_path
+            ):
+                _stop(proc)
+                proc = self._diff_tree = self._start_batch(
+                    "diff-tree",
+                    "--stdin",
+                    "--no-commit-id",
+                    "--root",
+                    "--patch",
+                    "--no-renames",
+                    "-U3",
+                    "--",
+                    file_path,
+                )
+                self._diff_tree_path = file_path
+            assert proc.stdin is not None and proc.stdout is not None
+            data = bytearray()
+            complete = False
+            try:
+                # Lines that are not object names are echoed back verbatim,
+                # which frames the diff without knowing its length up front.
+                proc.stdin.write(request.encode() + _DIFF_END)
+                while not complete:
+                    chunk = proc.stdout.read(_READ_SIZE)
+                    if not chunk:
+                        break
+                    data += chunk
+                    complete = data == _DIFF_END or data.endswith(_DIFF_LINE_END)
+            except (BrokenPipeError, ValueError):
+                pass
+            if not complete:
+                # Some bad objects make diff-tree exit; start afresh next time.
+                _stop(proc)
+                self._diff_tree = None
+        if not complete:
+            self._check_commits(oid, parent_oid)
+            raise GitError("git diff-tree exited unexpectedly")
+        # Trim in place and decode once; slicing would copy the whole diff.
+        del data[-len(_DIFF_END) :]
+        if not data:
+            # diff-tree reports other bad objects on (discarded) stderr and
+            # answers with nothing; tell a real empty diff from a missing one.
+            self._check_commits(oid, parent_oid)
+        return data.decode("utf-8", "replace")
+
+    def _check_commits(self, *oids: Optional[str]) -> None:
+        """Raise :class:`GitError` unless every given commit exists."""
+        for oid in oids:
+            if oid and self._cat_object(f"{oid}^{{commit}}") is None:
+                raise GitError(f"fatal: bad object {oid}")
 
     def list_file_commits(
-        self, file_path: str, limit: int = 256, follow: bool = True
+        self,
+        file_path: str,
+        limit: int = 256,
+        follow: Literal["auto", "always", "never"] | bool = "auto",
     ) -> List[GitCommit]:
-        """Return commits affecting the given file ordered by recency."""
+        """Return commits affecting the given file ordered by recency.
+
+        ``--follow`` makes git run rename detection on every commit it walks,
+        which dominates on large repositories. In ``"auto"`` mode the plain
+        path-limited log runs first and ``--follow`` is only added when that
+        finds nothing, or when the history stops short of ``limit`` at a
+        commit that renamed the file into place. ``True``/``False`` are
+        accepted as ``"always"``/``"never"``.
+        """
+        if follow is True:
+            follow = "always"
+        elif follow is False:
+            follow = "never"
+        elif follow not in ("auto", "always", "never"):
+            raise ValueError(f"invalid follow mode: {follow!r}")
+        if follow != "auto":
+            always = follow == "always"
+            return list(self.iter_file_commits(file_path, limit, always))
+        commits = list(self.iter_file_commits(file_path, limit, False))
+        if not commits:
+            if os.path.exists(os.path.join(self._path, file_path)):
+                return list(self.iter_file_commits(file_path, limit, True))
+        elif len(commits) < limit and self._renamed_in(commits[-1].oid, file_path):
+            return list(self.iter_file_commits(file_path, limit, True))
+        return commits
+
+    def _renamed_in(self, oid: str, file_path: str) -> bool:
+        """Return whether ``oid`` created ``file_path`` by renaming another file."""
+        result = self._run(
+            "diff-tree",
+            "--no-commit-id",
+            "-r",
+            "-M",
+            "--diff-filter=R",
+            "--name-only",
+            oid,
+        )
+        return file_path.encode() in result.stdout.splitlines()
+
+    def iter_file_commits(
+        self, file_path: str, limit: int = 256, follow: bool = False
+    ) -> Iterator[GitCommit]:
+        """Yield commits affecting the given file as git log produces them.
+
+        Unlike :meth:`list_file_commits` this never retries with ``--follow``;
+        closing the iterator early stops the underlying git process.
+        """
         pretty = "%H%x1f%P%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b%x1e"
-        args = [
+        # log.follow=true would otherwise add --follow behind our back.
+        args = [] if follow else ["-c", "log.follow=false"]
+        args += [
             "log",
             f"-n{limit}",
             "--date=iso8601-strict",
@@ -59,49 +340,226 @@ class GitRepository:
         if follow:
             args.append("--follow")
         args.extend(["--", file_path])
-        result = self._run(*args)
-        commits: List[GitCommit] = []
-        for entry in filter(None, result.stdout.split("\x1e")):
-            (
-                oid,
-                parents,
-                author_name,
-                author_email,
-                authored_at,
-                title,
-                body,
-            ) = entry.split("\x1f")
-            oid = oid.strip()
-            parent_list = [p.strip() for p in parents.split(" ") if p.strip()]
-            commits.append(
-                GitCommit(
-                    oid=oid,
-                    parent_oids=parent_list,
-                    author_name=author_name.strip(),
-                    author_email=author_email.strip(),
-                    authored_at=datetime.fromisoformat(authored_at.strip()),
-                    title=title.strip(),
-                    body=body.rstrip(),
+        fromisoformat = datetime.fromisoformat
+        proc = self._popen(*args)
+        assert proc.stdout is not None and proc.stderr is not None
+        with proc:
+            for match in _iter_log_records(proc.stdout):
+                (
+                    oid,
+                    parents,
+                    author_name,
+                    author_email,
+                    authored_at,
+                    title,
+                    body,
+                ) = match.groups()
+                # Hashes and iso8601 dates are plain ASCII; only the free-text
+                # fields need the (slower) lenient UTF-8 decode.
+                date = authored_at.decode("ascii")
+                yield GitCommit(
+                    oid=oid.decode("ascii"),
+                    parent_oids=tuple(parents.decode("ascii").split()),
+                    author_name=author_name.decode("utf-8", "replace"),
+                    author_email=author_email.decode("utf-8", "replace"),
+                    authored_at=fromisoformat(date),
+                    title=title.decode("utf-8", "replace"),
+                    body=body.decode("utf-8", "replace").rstrip(),
+                    # iso8601-strict is YYYY-MM-DDTHH:MM:SS<tz>.
+                    date_str=f"{date[:10]} {date[11:19]}",
                 )
-            )
-        return commits
+            stderr = proc.stderr.read()
+        if proc.returncode:
+            raise GitError(stderr.decode("utf-8", "replace").strip())
 
-    @lru_cache(maxsize=128)
     def get_file_diff(
-        self, oid: str, file_path: str, parent_oid: Optional[str] = None
+        self,
+        oid: str,
+        file_path: str,
+        parent_oid: Optional[str] = None,
+        *,
+        renames: bool = False,
     ) -> str:
-        """Return the diff for the file between this commit and its parent."""
-        args = ["show", oid, "--patch", "--stat", "--", file_path]
+        """Return the diff for the file between this commit and its parent.
+
+        Rename detection is off unless ``renames`` is set; with a single
+        pathspec it only adds similarity scans over the rest of the commit.
+        External diff drivers and textconv filters are bypassed as well, so
+        only git's own patch is computed. Without ``renames`` the diff comes
+        from a persistent ``git diff-tree``; a one-shot ``git diff`` (or
+        ``git show`` for root commits) runs only when ``renames`` is set.
+        Either way the result is the bare patch, with no commit header.
+        """
+        key = (oid, file_path, parent_oid, renames)
+        cached = self._diff_cache.get(key)
+        if cached is not None:
+            return cached
+        if not renames:
+            diff = self._diff(oid, file_path, parent_oid)
+            self._diff_cache.put(key, diff, sys.getsizeof(diff))
+            return diff
         if parent_oid:
-            args = ["diff", f"{parent_oid}", oid, "--", file_path]
-        result = self._run(*args)
-        return result.stdout
+            args = [
+                "diff",
+                "--find-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "--no-textconv",
+                "-U3",
+                parent_oid,
+                oid,
+                "--",
+                file_path,
+            ]
+        else:
+            args = [
+                "show",
+                "--format=",
+                "--find-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "--no-textconv",
+                "--patch",
+                oid,
+                "--",
+                file_path,
+            ]
+        diff = self._run(*args).stdout.decode("utf-8", "replace")
+        self._diff_cache.put(key, diff, sys.getsizeof(diff))
+        return diff
+
+    def iter_file_diffs(self, file_path: str, limit: int = 256) -> Iterator[str]:
+        """Cache the diffs of commits touching ``file_path`` from one ``git log``.
+
+        Each diff is stored as :meth:`get_file_diff` would return it for the
+        commit against its first parent, and the commit id is yielded once it
+        is; closing the iterator early stops the underlying git process.
+        """
+        # Porcelain log also reads user settings that diff-tree ignores
+        # (log.follow, log.showRoot, diff.algorithm, diff.interHunkContext);
+        # pin them so the cached patches match what diff-tree would return.
+        proc = self._popen(
+            "-c",
+            "log.follow=false",
+            "log",
+            f"-n{limit}",
+            "--patch",
+            "--root",
+            "--diff-algorithm=myers",
+            "--inter-hunk-context=0",
+            "--no-renames",
+            "--no-color",
+            "--no-ext-diff",
+            "--no-textconv",
+            "--diff-merges=first-parent",
+            "-U3",
+            "--format=%x1e%H %P",
+            "--",
+            file_path,
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        with proc:
+            for record in _iter_diff_records(proc.stdout):
+                # A blank line separates the format line from the patch.
+                header, _, diff = record.partition(b"\n\n")
+                oid, _, parents = header.strip(b"\x1e\n").decode("ascii").partition(" ")
+                parent = parents.split(" ", 1)[0] or None
+                text = diff.decode("utf-8", "replace")
+                self._diff_cache.put(
+                    (oid, file_path, parent, False), text, sys.getsizeof(text)
+                )
+                yield oid
+            stderr = proc.stderr.read()
+        if proc.returncode:
+            raise GitError(stderr.decode("utf-8", "replace").strip())
 
-    @lru_cache(maxsize=256)
     def get_file_contents(self, oid: str, file_path: str) -> str:
         """Return the file contents at a specific commit."""
-        result = self._run("show", f"{oid}:{file_path}")
-        return result.stdout
+        key = (oid, file_path)
+        cached = self._contents_cache.get(key)
+        if cached is not None:
+            return cached
+        contents = self._cat(oid, file_path)
+        self._contents_cache.put(key, contents, sys.getsizeof(contents))
+        return contents
+
+    def get_file_lines(self, oid: str, file_path: str) -> tuple[str, ...]:
+        """Return the file contents at a specific commit split into lines."""
+        key = (oid, file_path)
+        cached = self._lines_cache.get(key)
+        if cached is not None:
+            return cached
+        contents = self.get_file_contents(oid, file_path)
+        # Split on "\n" only, as git does for diffs: str.splitlines() also
+        # breaks on form feeds, "\x1c"-"\x1e", "\x85" and "\u2028", which
+        # would shift every later line against the diff's line numbers.
+        split = contents.split("\n")
+        if not split[-1]:
+            split.pop()
+        if "\r" in contents:
+            split = [line.rstrip("\r") for line in split]
+        lines = tuple(split)
+        # Every line is its own str object, each with ~50 bytes of overhead.
+        size = sys.getsizeof(lines) + sum(map(sys.getsizeof, lines))
+        self._lines_cache.put(key, lines, size)
+        return lines
+
+
+def _stop(proc: subprocess.Popen | None) -> None:
+    """Close a persistent git process's stdin and wait for it to exit."""
+    if proc is None:
+        return
+    try:
+        if proc.stdin:
+            proc.stdin.close()
+        proc.wait(timeout=1)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+    finally:
+        if proc.stdout:
+            proc.stdout.close()
+
+
+def _iter_diff_records(stream: IO[bytes]) -> Iterator[bytearray]:
+    """Yield ``git log --patch`` records from ``stream`` as they complete."""
+    # Records start with "\x1e" at the beginning of a line, which no patch
+    # line can (they all carry a prefix character).
+    separator = b"\n\x1e"
+    buffer = bytearray()
+    while True:
+        chunk = stream.read1(_READ_SIZE)
+        if not chunk:
+            break
+        # Only the new bytes need scanning, plus one byte in case the
+        # separator straddles two reads.
+        start = max(0, len(buffer) - 1)
+        buffer += chunk
+        end = buffer.find(separator, start)
+        while end >= 0:
+            yield buffer[: end + 1]
+            del buffer[: end + 2]
+            end = buffer.find(separator)
+    if buffer:
+        yield bytes(buffer)
+
+
+def _iter_log_records(stream: IO[bytes]) -> Iterator[re.Match[bytes]]:
+    """Yield complete ``git log`` records from ``stream`` as they arrive."""
+    # Chunks without a record separator are only collected; they are joined
+    # once a separator shows up, so a record spanning many reads is copied
+    # once rather than on every read.
+    parts: List[bytes] = []
+    while True:
+        chunk = stream.read1(_READ_SIZE)
+        if not chunk:
+            break
+        end = chunk.rfind(b"\x1e")
+        if end < 0:
+            parts.append(chunk)
+            continue
+        parts.append(chunk[: end + 1])
+        yield from _LOG_RECORD_RE.finditer(b"".join(parts))
+        parts = [chunk[end + 1 :]]
 
 
 def iter_walker(commits: Iterable[GitCommit]) -> Iterable[GitCommit]:
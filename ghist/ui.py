@@ -1,24 +1,40 @@
 from __future__ import annotations
 
+import io
 import os
-from collections import defaultdict
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from textwrap import wrap
 from typing import Iterable, List
 
-from rich.console import Group
+from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.segment import Segment
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
-from textual import events
+from textual import events, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
+from textual.strip import Strip
+from textual.timer import Timer
 from textual.widgets import Button, Header, Input, RichLog, Static
+from textual.worker import get_current_worker
 
 from . import __version__
 from .git_data import GitCommit, GitRepository, GitError
 
 
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+_GIT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ghist-git")
+# Shared Style objects for the diff colours; Rich uses a Style as is, where a
+# style string is looked up again every time a span is rendered.
+_ADDED_STYLE = Style(color="green")
+_REMOVED_STYLE = Style(color="red")
+
 DEFAULT_CSS = """
 Screen {
     layout: vertical;
@@ -109,6 +125,22 @@ class VersionFooter(Static):
         self.update(f"ghist {self._version}  •  {help_text}")
 
 
+class _RenderedLines:
+    """Rich renderable replaying lines the detail log has already rendered."""
+
+    def __init__(self, strips: List[Strip]) -> None:
+        self.strips = strips
+        self.width = max(strip.cell_length for strip in strips)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        new_line = Segment.line()
+        for strip in self.strips:
+            yield from strip
+            yield new_line
+
+
 class _HistoryApp(App):
     """Textual application presenting git history for a single file."""
 
@@ -120,6 +152,13 @@ class _HistoryApp(App):
         Binding("f", "prompt_file", "Select file", key_display="f"),
         Binding("tab", "focus_cycle", "Cycle focus", show=False),
     ]
+    PREFETCH_DELAY = 0.15
+    PREFETCH_OFFSETS = (1, -1, 2, -2)
+    FIT_CACHE_SIZE = 64
+    RENDER_CACHE_SIZE = 32
+    # Rendered strips are held per terminal row, so also bound the total.
+    RENDER_CACHE_LINES = 100_000
+    CONTEXT_CACHE_SIZE = 64
 
     def __init__(
         self,
@@ -136,10 +175,26 @@ class _HistoryApp(App):
         self.file_path = file_path
         self.launch_cwd = launch_cwd
         self.limit = limit
+        self._repo_path = os.path.normpath(repo.path)
+        self._repo_prefix = os.path.join(self._repo_path, "")
         self.detail_log: RichLog | None = None
         self._current_index = 0
         self._header_widths: tuple[int, int] | None = None
+        self._header_widths_for = -1
         self._header_height: int | None = None
+        self._fit_cache: OrderedDict[tuple[str, int, int, str | None], Text] = (
+            OrderedDict()
+        )
+        self._render_cache: OrderedDict[
+            tuple[str, str, int, int, int], _RenderedLines
+        ] = OrderedDict()
+        self._render_cache_lines = 0
+        self._context_cache: OrderedDict[tuple[str, str], Text] = OrderedDict()
+        # The prefetch threads store into the context cache as well.
+        self._context_lock = threading.Lock()
+        self._prefetch = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_pending: dict[tuple[str, str], Future[None]] = {}
+        self._prefetch_timer: Timer | None = None
         self.title = f"git history: {file_path}"
         self.sub_title = repo.path
 
@@ -162,9 +217,13 @@ class _HistoryApp(App):
         self._header_widths = None
         self._header_height = None
         self._select_index(0)
+        self._prefetch_file_diffs(self.file_path)
         self.call_after_refresh(self._refresh_current_commit)
         self.set_focus(self.detail_log)
 
+    def on_unmount(self) -> None:
+        self._prefetch.shutdown(wait=False, cancel_futures=True)
+
     def action_prev_commit(self) -> None:
         if not self.commits:
             return
@@ -183,28 +242,115 @@ class _HistoryApp(App):
     def on_resize(self, event: events.Resize) -> None:
         self._header_widths = None
         self._header_height = None
+        self._fit_cache.clear()
+        self._clear_render_cache()
         self.call_after_refresh(self._refresh_current_commit)
 
     def _show_commit(self, commit: GitCommit, index: int) -> None:
         assert self.detail_log is not None
+        left_width, right_width = self._compute_header_widths()
+        header_height = self._compute_header_height()
+        key = (commit.oid, self.file_path, left_width, right_width, header_height)
+        rendered = self._render_cache.get(key)
+        # Clearing, writing and scrolling each request a repaint; batch them
+        # so a navigation paints the log once.
+        with self.batch_update():
+            self.detail_log.clear()
+            if rendered is not None:
+                self._render_cache.move_to_end(key)
+                self.detail_log.write(rendered, width=rendered.width)
+            elif (context := self._cached_context(commit)) is None:
+                # The header needs no git calls: paint it now and let a worker
+                # load the file and diff, which re-shows the commit when done.
+                renderable = self._render_commit(
+                    commit,
+                    index,
+                    left_width,
+                    right_width,
+                    header_height,
+                    Text("Loading…", style="italic"),
+                )
+                self.detail_log.write(renderable)
+                self._load_commit_context(commit, index, self.file_path)
+            else:
+                renderable = self._render_commit(
+                    commit, index, left_width, right_width, header_height, context
+                )
+                self.detail_log.write(renderable)
+                # Keep the rendered strips (if the write was not deferred) so a
+                # revisit skips Table layout and Text wrapping entirely.
+                if self.detail_log.lines:
+                    self._cache_render(key, list(self.detail_log.lines))
+            self.detail_log.scroll_home()
+
+    def _cache_render(
+        self, key: tuple[str, str, int, int, int], strips: List[Strip]
+    ) -> None:
+        if len(strips) > self.RENDER_CACHE_LINES:
+            return
+        self._render_cache[key] = _RenderedLines(strips)
+        self._render_cache_lines += len(strips)
+        while (
+            len(self._render_cache) > self.RENDER_CACHE_SIZE
+            or self._render_cache_lines > self.RENDER_CACHE_LINES
+        ):
+            _, evicted = self._render_cache.popitem(last=False)
+            self._render_cache_lines -= len(evicted.strips)
+
+    def _clear_render_cache(self) -> None:
+        self._render_cache.clear()
+        self._render_cache_lines = 0
+
+    @work(exclusive=True, thread=True, group="commit-context")
+    def _load_commit_context(
+        self, commit: GitCommit, index: int, file_path: str
+    ) -> None:
+        # exclusive=True cancels the load for a commit navigated away from.
+        context = self._compute_context(commit, file_path)
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(
+                self._apply_context, commit, index, file_path, context
+            )
+
+    def _apply_context(
+        self, commit: GitCommit, index: int, file_path: str, context: Text
+    ) -> None:
+        self._store_context((commit.oid, file_path), context)
+        if (
+            file_path == self.file_path
+            and index == self._current_index
+            and self.commits[index] is commit
+        ):
+            self._show_commit(commit, index)
+
+    def _render_commit(
+        self,
+        commit: GitCommit,
+        index: int,
+        left_width: int,
+        right_width: int,
+        header_height: int,
+        context: Text,
+    ) -> Group:
         total = len(self.commits)
         message_parts: List[str] = []
         if commit.title:
             message_parts.append(commit.title)
-        if commit.body.strip():
-            message_parts.extend(commit.body.rstrip().splitlines())
+        # Bodies are right-stripped when parsed, so empty means no body.
+        if commit.body:
+            message_parts.extend(commit.body.splitlines())
         message_text = "\n".join(message_parts)
         message = Text(message_text, justify="left")
 
-        info = Text(justify="left")
-        info.append(f"commit: {commit.oid}\n")
-        info.append(f"author: {commit.author_name} <{commit.author_email}>\n")
-        info.append(f"date: {commit.authored_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        info.append(f"file: {self.file_path}\n")
-        info.append(f"position: {total - index}/{total} commits")
+        info = Text(
+            f"commit: {commit.oid}\n"
+            f"author: {commit.author}\n"
+            f"date: {commit.date_str}\n"
+            f"file: {self.file_path}\n"
+            f"position: {total - index}/{total} commits",
+            justify="left",
+        )
 
-        left_width, right_width = self._compute_header_widths()
-        header_height = self._compute_header_height()
         info = self._fit_text_height(info, header_height, left_width)
         message = self._fit_text_height(
             message,
@@ -229,111 +375,184 @@ class _HistoryApp(App):
         )
         header.add_row(info, message)
 
+        return Group(header, Text("\n"), context)
+
+    def _cached_context(self, commit: GitCommit) -> Text | None:
+        # The file/diff view does not depend on the terminal size, so it is
+        # cached apart from the header and survives resizes.
+        key = (commit.oid, self.file_path)
+        with self._context_lock:
+            context = self._context_cache.get(key)
+            if context is not None:
+                self._context_cache.move_to_end(key)
+        return context
+
+    def _store_context(self, key: tuple[str, str], context: Text) -> None:
+        with self._context_lock:
+            self._context_cache[key] = context
+            if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+
+    def _compute_context(self, commit: GitCommit, file_path: str) -> Text:
+        """Build the file/diff view for a commit; safe to call off-thread."""
         (
             file_lines,
             file_error,
             add_count,
             del_count,
             added_lines,
-            removed_before,
-        ) = self._prepare_context(commit)
-        context = self._build_context_text(
-            file_lines, file_error, add_count, del_count, added_lines, removed_before
+            removed,
+        ) = self._prepare_context(commit, file_path)
+        return self._build_context_text(
+            file_path,
+            file_lines,
+            file_error,
+            add_count,
+            del_count,
+            added_lines,
+            removed,
         )
-        self.detail_log.clear()
-        self.detail_log.write(Group(header, Text("\n"), context))
-        self.detail_log.scroll_home()
 
     def _prepare_context(
-        self, commit: GitCommit
-    ) -> tuple[List[str], str | None, int, int, set[int], dict[int, List[tuple[int, str]]]]:
+        self, commit: GitCommit, file_path: str
+    ) -> tuple[
+        tuple[str, ...], str | None, int, int, set[int], List[tuple[int, int, str]]
+    ]:
+        # The diff and the file contents come from independent git calls, so
+        # run the diff on the pool while the contents load here.
+        parent = commit.parent_oids[0] if commit.parent_oids else None
+        diff_future = _GIT_POOL.submit(
+            self.repo.get_file_diff, commit.oid, file_path, parent
+        )
         try:
-            file_text = self.repo.get_file_contents(commit.oid, self.file_path)
-            file_lines = file_text.splitlines()
+            file_lines = self.repo.get_file_lines(commit.oid, file_path)
             file_error: str | None = None
         except GitError as err:
-            file_lines = []
+            file_lines = ()
             file_error = str(err)
-        parent = commit.parent_oids[0] if commit.parent_oids else None
-        diff_lines = self.repo.get_file_diff(commit.oid, self.file_path, parent).splitlines()
+        try:
+            diff = diff_future.result()
+        except GitError as err:
+            # e.g. a parent missing from a shallow clone: report it rather
+            # than showing the file as unchanged.
+            diff = ""
+            file_error = file_error or str(err)
+        # Iterating a StringIO walks the diff in place (splitting on "\n" only)
+        # instead of materializing a list of every line.
+        diff_lines = io.StringIO(diff)
         added_lines: set[int] = set()
-        removed_before: dict[int, List[tuple[int, str]]] = defaultdict(list)
+        # (new-file line the deletion precedes, old line number, text); diff
+        # hunks are ordered, so this list is already sorted by its first item.
+        removed: List[tuple[int, int, str]] = []
         add_count = del_count = 0
         current_old = current_new = 0
+        add_added = added_lines.add
+        add_removed = removed.append
+        hunk_match = _HUNK_RE.match
+        # Diff line kinds are decided by their first character. "---"/"+++"
+        # file headers only occur before a file's first hunk, so body lines
+        # need no prefix test; other extended headers fall through untouched.
+        # Lines read from a StringIO are never empty, so indexing is safe.
+        in_hunk = False
         for line in diff_lines:
-            if line.startswith("@@"):
-                try:
-                    header = line.split("@@")[1].strip()
-                    old_part, new_part = header.split(" ")
-                except ValueError:
-                    old_part, new_part = "-1,0", "+1,0"
-                old_start = int(old_part.split(",")[0].replace("-", ""))
-                new_start = int(new_part.split(",")[0].replace("+", ""))
-                current_old = old_start
-                current_new = new_start
-                continue
-            if line.startswith("diff ") or line.startswith("index"):
-                continue
-            if line.startswith("---") or line.startswith("+++"):
-                continue
-            if line.startswith("-"):
-                key = current_new if current_new else 1
-                removed_before[key].append((current_old, line[1:]))
+            kind = line[0]
+            if kind == " ":
                 current_old += 1
-                del_count += 1
-            elif line.startswith("+"):
-                key = current_new if current_new else 1
-                added_lines.add(key)
                 current_new += 1
-                add_count += 1
-            elif line.startswith(" "):
+            elif kind == "-":
+                if not in_hunk:
+                    continue
+                add_removed((current_new or 1, current_old, line[1:].rstrip("\r\n")))
                 current_old += 1
+                del_count += 1
+            elif kind == "+":
+                if not in_hunk:
+                    continue
+                add_added(current_new or 1)
                 current_new += 1
-        return file_lines, file_error, add_count, del_count, added_lines, removed_before
+                add_count += 1
+            elif kind == "@":
+                in_hunk = True
+                match = hunk_match(line)
+                if match:
+                    current_old = int(match.group(1))
+                    current_new = int(match.group(2))
+                else:
+                    current_old = current_new = 1
+            elif kind == "d":
+                in_hunk = False
+        return file_lines, file_error, add_count, del_count, added_lines, removed
+
     def _build_context_text(
         self,
-        file_lines: List[str],
+        file_path: str,
+        file_lines: tuple[str, ...],
         file_error: str | None,
         add_count: int,
         del_count: int,
         added_lines: set[int],
-        removed_before: dict[int, List[tuple[int, str]]],
+        removed: List[tuple[int, int, str]],
     ) -> Text:
-        text = Text()
-        header = Text.assemble(
-            ("Edited ", ""),
-            (self.file_path, ""),
-            (" (", ""),
-            (f"+{add_count}", "green"),
-            (", ", ""),
-            (f"-{del_count}", "red"),
-            (")\n", ""),
-        )
-        text.append(header)
-        text.append("\n")
+        # Only the counts are styled, so the header goes straight into the
+        # result rather than through an intermediate assembled Text.
+        text = Text(f"Edited {file_path} (")
+        text.append(f"+{add_count}", style=_ADDED_STYLE)
+        text.append(", ")
+        text.append(f"-{del_count}", style=_REMOVED_STYLE)
+        text.append(")\n\n")
         if file_error:
             text.append("Unable to load current file:\n", style="bold red")
             text.append(f"{file_error}\n")
             return text
-        final_key = len(file_lines) + 1
-        for line_no in range(1, len(file_lines) + 1):
-            for old_line, removed_text in removed_before.pop(line_no, []):
-                text.append(f"{old_line:5d} -{removed_text}\n", style="red")
-            line_text = file_lines[line_no - 1]
+        if not add_count and not del_count:
+            # Nothing to colour (e.g. a --follow hit that left this file as
+            # is): emit the whole file as a single unstyled run.
+            if file_lines:
+                text.append(
+                    "".join(
+                        f"{line_no:5d}  {line_text}\n"
+                        for line_no, line_text in enumerate(file_lines, 1)
+                    )
+                )
+            return text
+        # Contiguous lines sharing a style are appended as one run so the
+        # Text holds one span per colour change rather than one per line.
+        run: List[str] = []
+        run_style: Style | None = None
+
+        def emit(line: str, style: Style | None) -> None:
+            nonlocal run_style
+            if style is not run_style:
+                if run:
+                    text.append("".join(run), style=run_style)
+                    run.clear()
+                run_style = style
+            run.append(line)
+
+        # Walk file lines and the (sparse) deletions together in one pass.
+        removed_count = len(removed)
+        ridx = 0
+        run_append = run.append
+        for line_no, line_text in enumerate(file_lines, 1):
+            while ridx < removed_count and removed[ridx][0] <= line_no:
+                _, old_line, removed_text = removed[ridx]
+                emit(f"{old_line:5d} -{removed_text}\n", _REMOVED_STYLE)
+                ridx += 1
             if line_no in added_lines:
-                text.append(f"{line_no:5d} +{line_text}\n", style="green")
+                emit(f"{line_no:5d} +{line_text}\n", _ADDED_STYLE)
+            elif run_style is not None:
+                emit(f"{line_no:5d}  {line_text}\n", None)
             else:
-                text.append(f"{line_no:5d}  {line_text}\n")
-        for old_line, removed_text in removed_before.pop(final_key, []):
-            text.append(f"{old_line:5d} -{removed_text}\n", style="red")
-        for remaining in removed_before.values():
-            for old_line, removed_text in remaining:
-                text.append(f"{old_line:5d} -{removed_text}\n", style="red")
+                # An unchanged line extending a neutral run: the common case.
+                run_append(f"{line_no:5d}  {line_text}\n")
+        # Deletions at the end of the file (or past it) trail the last line.
+        for _, old_line, removed_text in removed[ridx:]:
+            emit(f"{old_line:5d} -{removed_text}\n", _REMOVED_STYLE)
+        if run:
+            text.append("".join(run), style=run_style)
         return text
 
     def _compute_header_widths(self) -> tuple[int, int]:
-        if self._header_widths and all(w > 0 for w in self._header_widths):
-            return self._header_widths
         available = 0
         if self.detail_log and self.detail_log.size.width > 0:
             available = self.detail_log.size.width
@@ -341,6 +560,11 @@ class _HistoryApp(App):
             available = self.screen.size.width
         if available <= 0:
             available = 120
+        # Keyed on the width they were derived from, so a fallback computed
+        # before the first layout is not reused once the real size is known.
+        if self._header_widths and available == self._header_widths_for:
+            return self._header_widths
+        self._header_widths_for = available
         usable = max(40, available - 4)
         left = max(20, (usable * 3) // 5)
         right = max(15, usable - left)
@@ -356,6 +580,11 @@ class _HistoryApp(App):
     def _fit_text_height(
         self, text: Text, height: int, width: int, first_line_style: str | None = None
     ) -> Text:
+        key = (text.plain, height, width, first_line_style)
+        cached = self._fit_cache.get(key)
+        if cached is not None:
+            self._fit_cache.move_to_end(key)
+            return cached
         raw_lines = text.plain.splitlines() or [""]
         max_width = max(1, width - 1)
         wrapped: List[tuple[str, str | None]] = []
@@ -378,14 +607,19 @@ class _HistoryApp(App):
             wrapped.extend([("", None)] * (height - len(wrapped)))
         else:
             wrapped = wrapped[:height]
-        result = Text(justify="left")
-        for idx, (segment, segment_style) in enumerate(wrapped):
-            if idx:
-                result.append("\n")
+        # Build the text from one joined string; at most one line is styled.
+        result = Text(
+            "\n".join(segment for segment, _ in wrapped), justify="left"
+        )
+        offset = 0
+        for segment, segment_style in wrapped:
             if segment_style:
-                result.append(segment, style=segment_style)
-            else:
-                result.append(segment)
+                result.stylize(segment_style, offset, offset + len(segment))
+                break
+            offset += len(segment) + 1
+        self._fit_cache[key] = result
+        if len(self._fit_cache) > self.FIT_CACHE_SIZE:
+            self._fit_cache.popitem(last=False)
         return result
 
     def _refresh_current_commit(self) -> None:
@@ -400,6 +634,62 @@ class _HistoryApp(App):
         commit = self.commits[index]
         self._current_index = index
         self._show_commit(commit, index)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        # Debounce so rapid key repeats don't queue work for skipped commits.
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        self._prefetch_timer = self.set_timer(
+            self.PREFETCH_DELAY, self._prefetch_neighbours
+        )
+
+    def _prefetch_neighbours(self) -> None:
+        self._prefetch_timer = None
+        for offset in self.PREFETCH_OFFSETS:
+            index = self._current_index + offset
+            if not 0 <= index < len(self.commits):
+                continue
+            key = (self.commits[index].oid, self.file_path)
+            if key in self._prefetch_pending or key in self._context_cache:
+                continue
+            self._prefetch_pending[key] = self._prefetch.submit(
+                self._warm_commit, self.commits[index], self.file_path
+            )
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        for future in list(self._prefetch_pending.values()):
+            future.cancel()
+        self._prefetch_pending.clear()
+
+    def _warm_commit(self, commit: GitCommit, file_path: str) -> None:
+        """Build a commit's file/diff view on a worker thread."""
+        # Building the view (not just fetching its git data) lets navigating
+        # to a prefetched neighbour render in one pass, without "Loading…".
+        try:
+            context = self._compute_context(commit, file_path)
+        except GitError:
+            pass
+        else:
+            self._store_context((commit.oid, file_path), context)
+        finally:
+            self._prefetch_pending.pop((commit.oid, file_path), None)
+
+    @work(exclusive=True, thread=True, group="prefetch-diffs")
+    def _prefetch_file_diffs(self, file_path: str) -> None:
+        # One git log fills the diff cache for the whole history instead of
+        # a diff-tree round trip per commit. It is only a warm-up, so errors
+        # are left to the on-demand path to report.
+        worker = get_current_worker()
+        try:
+            for _ in self.repo.iter_file_diffs(file_path, self.limit):
+                if worker.is_cancelled:
+                    break
+        except GitError:
+            pass
 
     def _handle_file_selection(self, file_path: str | None) -> None:
         if not file_path:
@@ -412,21 +702,37 @@ class _HistoryApp(App):
         except ValueError as err:
             self._show_status(str(err), severity="warning")
             return
+        self._show_status(f"Loading {rel_path}…", severity="information")
+        self._fetch_file_commits(rel_path)
+
+    @work(exclusive=True, thread=True, group="load-file")
+    def _fetch_file_commits(self, rel_path: str) -> None:
+        # exclusive=True cancels a previous load still running in this group.
         try:
             commits = self.repo.list_file_commits(rel_path, limit=self.limit)
         except Exception as err:
-            self._show_status(f"{err}", severity="error")
+            if not get_current_worker().is_cancelled:
+                self.call_from_thread(self._show_status, f"{err}", severity="error")
             return
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_commits, rel_path, commits)
+
+    def _apply_commits(self, rel_path: str, commits: List[GitCommit]) -> None:
         if not commits:
             self._show_status(f"No commits found for {rel_path}", severity="warning")
             return
+        self._cancel_prefetch()
         self.commits = commits
         self.file_path = rel_path
         self.title = f"git history: {rel_path}"
+        self._clear_render_cache()
+        with self._context_lock:
+            self._context_cache.clear()
         self._current_index = 0
         self._header_widths = None
         self._header_height = None
         self._select_index(0)
+        self._prefetch_file_diffs(rel_path)
         self._show_status(f"Loaded {rel_path}", severity="information")
 
     def _resolve_file_input(self, raw: str) -> tuple[str, str]:
@@ -441,13 +747,9 @@ class _HistoryApp(App):
             raise ValueError(f"File does not exist: {abs_path}")
         if os.path.isdir(abs_path):
             raise ValueError("Path points to a directory; expected a file.")
-        try:
-            common = os.path.commonpath([self.repo.path, abs_path])
-        except ValueError:
-            common = ""
-        if common != self.repo.path:
+        if abs_path != self._repo_path and not abs_path.startswith(self._repo_prefix):
             raise ValueError(f"{abs_path} is outside repository {self.repo.path}")
-        rel_path = os.path.relpath(abs_path, self.repo.path).replace(os.sep, "/")
+        rel_path = os.path.relpath(abs_path, self._repo_path).replace(os.sep, "/")
         return abs_path, rel_path
 
     def _show_status(self, message: str, *, severity: str = "information") -> None:
@@ -470,7 +772,7 @@ class HistoryTUI:
         limit: int,
     ) -> None:
         self._app = _HistoryApp(
-            repo, list(commits), file_path, launch_cwd=launch_cwd, limit=limit
+            repo, commits, file_path, launch_cwd=launch_cwd, limit=limit
         )
 
     def run(self) -> None:
@@ -0,0 +1,117 @@
+import os
+import subprocess
+import tempfile
+import unittest
+
+from ghist.git_data import GitRepository
+
+
+def _git(cwd: str, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+class DiffFramingTest(unittest.TestCase):
+    """The persistent diff-tree must not stop at marker text inside a file."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = self._tmp.name
+        _git(self.path, "init", "-q")
+        self._commit(b"first\n")
+        self._commit(b"first\nline\x1eghist-end\n")
+        self._commit(b"first\nline\x1eghist-end\nlast\n")
+        self.repo = GitRepository(self.path)
+
+    def tearDown(self) -> None:
+        self.repo.close()
+        self._tmp.cleanup()
+
+    def _commit(self, contents: bytes) -> None:
+        with open(os.path.join(self.path, "f.txt"), "wb") as handle:
+            handle.write(contents)
+        _git(self.path, "add", "f.txt")
+        _git(self.path, "commit", "-q", "-m", "change")
+
+    def test_marker_text_in_file_does_not_end_diff(self) -> None:
+        newest, middle, root = self.repo.list_file_commits("f.txt")
+        diff = self.repo.get_file_diff(middle.oid, "f.txt", middle.parent_oids[0])
+        self.assertTrue(diff.endswith("+line\x1eghist-end\n"))
+        # The same process must still be in step for the next request.
+        diff = self.repo.get_file_diff(newest.oid, "f.txt", newest.parent_oids[0])
+        self.assertTrue(diff.endswith("+last\n"))
+        diff = self.repo.get_file_diff(root.oid, "f.txt")
+        self.assertTrue(diff.endswith("+first\n"))
+
+
+class WarmedDiffTest(unittest.TestCase):
+    """iter_file_diffs must cache exactly what get_file_diff returns."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = self._tmp.name
+        _git(self.path, "init", "-q", "-b", "main")
+        # User settings that change what porcelain log or diff-tree print.
+        for name, value in (
+            ("log.follow", "true"),
+            ("log.showRoot", "false"),
+            ("diff.algorithm", "histogram"),
+            ("diff.interHunkContext", "10"),
+            ("diff.suppressBlankEmpty", "true"),
+        ):
+            _git(self.path, "config", name, value)
+        lines = [f"line {n}" for n in range(30)]
+        self._commit("old.txt", lines)
+        _git(self.path, "mv", "old.txt", "f.txt")
+        _git(self.path, "commit", "-q", "-m", "rename")
+        lines[5:5] = ["", "blank above"]
+        self._commit("f.txt", lines)
+        _git(self.path, "checkout", "-q", "-b", "side")
+        # Edits next to the blank line, so it becomes a context line.
+        self._commit("f.txt", lines[:7] + ["side edit"] + lines[8:])
+        _git(self.path, "checkout", "-q", "main")
+        self._commit("f.txt", ["main start"] + lines[1:])
+        _git(self.path, "merge", "-q", "--no-edit", "side")
+        self.repo = GitRepository(self.path)
+
+    def tearDown(self) -> None:
+        self.repo.close()
+        self._tmp.cleanup()
+
+    def _commit(self, name: str, lines: list[str]) -> None:
+        with open(os.path.join(self.path, name), "w") as handle:
+            handle.write("\n".join(lines) + "\n")
+        _git(self.path, "add", name)
+        _git(self.path, "commit", "-q", "-m", "change")
+
+    def test_warmed_diffs_match_get_file_diff(self) -> None:
+        fresh = GitRepository(self.path)
+        self.addCleanup(fresh.close)
+        for path in ("f.txt", "old.txt"):
+            commits = self.repo.list_file_commits(path, follow="never")
+            warmed = list(self.repo.iter_file_diffs(path))
+            self.assertEqual(warmed, [commit.oid for commit in commits])
+            for commit in commits:
+                parent = commit.parent_oids[0] if commit.parent_oids else None
+                self.assertEqual(
+                    self.repo.get_file_diff(commit.oid, path, parent),
+                    fresh.get_file_diff(commit.oid, path, parent),
+                    f"{path} at {commit.oid}",
+                )
+        merge = self.repo.list_file_commits("f.txt", follow="never")[0]
+        self.assertEqual(len(merge.parent_oids), 2)
+        # The side edit, seen from the first parent: the blank line above
+        # it is context and must keep its " " prefix.
+        diff = fresh.get_file_diff(merge.oid, "f.txt", merge.parent_oids[0])
+        self.assertIn("\n \n blank above\n", diff)
+        root = self.repo.list_file_commits("old.txt", follow="never")[-1]
+        self.assertFalse(root.parent_oids)
+        self.assertIn("+line 0\n", fresh.get_file_diff(root.oid, "old.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()